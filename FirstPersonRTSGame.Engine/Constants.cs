@@ -20,6 +20,11 @@ namespace FirstPersonRTSGame.Engine
         // Game speed
         public const float GameSpeed = 1.0f;
         
+        // Simulation timing
+        public const float FixedDeltaTime = 1.0f / 60.0f; // Length of one simulation step
+        public const float MaxFrameTime = 0.25f; // Longest frame the simulation will try to catch up on
+        public const double MaxFramesPerSecond = 144.0; // Frame rate cap without VSync when the monitor's refresh rate is unknown
+        
         // Ship settings
         public const float DefaultShipSpeed = 10.0f;
         public const float DefaultShipTurnSpeed = 2.0f;
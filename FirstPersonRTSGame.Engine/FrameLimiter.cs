@@ -0,0 +1,54 @@
+using System;
+using System.Diagnostics;
+using System.Threading;
+
+namespace FirstPersonRTSGame.Engine
+{
+    /// <summary>
+    /// Caps the frame rate by waiting out the rest of each frame.
+    /// Sleeps for most of the remaining time and spins for the last couple of
+    /// milliseconds, since Thread.Sleep can overshoot by a whole scheduler tick.
+    /// </summary>
+    public sealed class FrameLimiter
+    {
+        // Sleeping any closer to the deadline than this risks oversleeping
+        private static readonly long SpinTicks = Stopwatch.Frequency * 2 / 1000;
+        
+        private readonly Stopwatch stopwatch = Stopwatch.StartNew();
+        private readonly long frameTicks;
+        private long nextFrameTicks;
+        
+        public FrameLimiter(double framesPerSecond)
+        {
+            if (framesPerSecond <= 0)
+                throw new ArgumentOutOfRangeException(nameof(framesPerSecond), "Frame rate must be positive");
+            
+            frameTicks = (long)(Stopwatch.Frequency / framesPerSecond);
+            nextFrameTicks = frameTicks;
+        }
+        
+        /// <summary>
+        /// Blocks until the current frame's time slot has passed.
+        /// </summary>
+        public void Wait()
+        {
+            long deadline = nextFrameTicks;
+            long remaining = deadline - stopwatch.ElapsedTicks;
+            
+            if (remaining > SpinTicks)
+            {
+                Thread.Sleep((int)((remaining - SpinTicks) * 1000 / Stopwatch.Frequency));
+            }
+            
+            while (stopwatch.ElapsedTicks < deadline)
+            {
+                Thread.SpinWait(1);
+            }
+            
+            // Schedule from the deadline so timing errors don't accumulate, unless we fell
+            // more than a frame behind, in which case don't rush to catch up
+            long now = stopwatch.ElapsedTicks;
+            nextFrameTicks = now - deadline > frameTicks ? now + frameTicks : deadline + frameTicks;
+        }
+    }
+} 
\ No newline at end of file
@@ -148,67 +148,69 @@ namespace FirstPersonRTSGame.Engine
         
         private void OnKeyDown(IKeyboard keyboard, Key key, int arg3)
         {
+            // Escape toggles pause and is the only key handled while paused
+            if (key == Key.Escape)
+            {
+                SetPaused(!isPaused);
+                return;
+            }
+            
+            if (isPaused)
+                return;
+            
             // Handle key presses
             switch (key)
             {
-                case Key.Escape:
-                    // Toggle pause
-                    isPaused = !isPaused;
-                    if (isPaused)
-                        ReleaseMouse();
-                    else
-                        GrabMouse();
-                    break;
-                    
                 case Key.Number1:
                 case Key.Keypad1:
-                    if (!isPaused)
-                        Console.WriteLine("Switch to ship 1");
+                    Console.WriteLine("Switch to ship 1");
                     break;
                     
                 case Key.Number2:
                 case Key.Keypad2:
-                    if (!isPaused)
-                        Console.WriteLine("Switch to ship 2");
+                    Console.WriteLine("Switch to ship 2");
                     break;
                     
                 case Key.Number3:
                 case Key.Keypad3:
-                    if (!isPaused)
-                        Console.WriteLine("Switch to ship 3");
+                    Console.WriteLine("Switch to ship 3");
                     break;
                     
                 case Key.E:
-                    if (!isPaused)
-                        Console.WriteLine("Interact with nearby object");
+                    Console.WriteLine("Interact with nearby object");
                     break;
                     
                 case Key.Space:
-                    if (!isPaused)
-                    {
-                        // Toggle building menu (would need UI implementation)
-                        Console.WriteLine("Toggle building menu");
-                    }
+                    // Toggle building menu (would need UI implementation)
+                    Console.WriteLine("Toggle building menu");
                     break;
                     
                 case Key.I:
-                    if (!isPaused)
-                    {
-                        // Toggle inventory display (would need UI implementation)
-                        Console.WriteLine("Toggle inventory");
-                    }
+                    // Toggle inventory display (would need UI implementation)
+                    Console.WriteLine("Toggle inventory");
                     break;
                     
                 case Key.B:
-                    if (!isPaused)
-                    {
-                        // Toggle building interaction (would need UI implementation)
-                        Console.WriteLine("Building interaction");
-                    }
+                    // Toggle building interaction (would need UI implementation)
+                    Console.WriteLine("Building interaction");
                     break;
             }
         }
         
+        private void SetPaused(bool paused)
+        {
+            isPaused = paused;
+            
+            // While paused nothing changes between frames, so block until the next
+            // input event instead of spinning the loop at full frame rate
+            window.IsEventDriven = paused;
+            
+            if (paused)
+                ReleaseMouse();
+            else
+                GrabMouse();
+        }
+        
         private void OnMouseMove(IMouse mouse, Vector2 position)
         {
             if (isPaused || !mouseGrabbed)
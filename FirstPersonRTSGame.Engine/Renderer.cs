@@ -30,6 +30,10 @@ namespace FirstPersonRTSGame.Engine
         private int terrainResolution = 100; // Number of grid cells per side
         private float terrainSize;
         
+        // World whose heights are currently uploaded to the terrain mesh; the terrain
+        // is static, so heights are only rebuilt when a different world is rendered
+        private IWorld? terrainSource;
+        
         // Camera
         private Matrix4x4 projectionMatrix;
         private Matrix4x4 viewMatrix;
@@ -88,14 +92,21 @@ namespace FirstPersonRTSGame.Engine
         
         public void Render(IWorld world, IPlayer player)
         {
-            // Update view matrix based on player's position and orientation
-            viewMatrix = CreateViewMatrix(player);
+            Render(world, player, player.Position);
+        }
+        
+        // Renders from the player's orientation at the given eye position, which may be
+        // interpolated between simulation steps
+        public void Render(IWorld world, IPlayer player, Vector3 eyePosition)
+        {
+            // Update view matrix based on eye position and player's orientation
+            viewMatrix = CreateViewMatrix(eyePosition, player);
             
             // Create combined view-projection matrix
             Matrix4x4 viewProj = viewMatrix * projectionMatrix;
             
             // Render skybox/horizon first (always at the back)
-            RenderSkybox(viewProj, player.Position);
+            RenderSkybox(viewProj, eyePosition);
             
             // Render terrain
             RenderTerrain(world, viewProj);
@@ -113,12 +124,12 @@ namespace FirstPersonRTSGame.Engine
             RenderShips(world.Ships, viewProj);
         }
         
-        private Matrix4x4 CreateViewMatrix(IPlayer player)
+        private Matrix4x4 CreateViewMatrix(Vector3 eyePosition, IPlayer player)
         {
-            // Create look-at matrix based on player's position and orientation
+            // Create look-at matrix based on eye position and player's orientation
             return Matrix4x4.CreateLookAt(
-                player.Position,
-                player.Position + player.Front,
+                eyePosition,
+                eyePosition + player.Front,
                 player.Up
             );
         }
@@ -150,8 +161,12 @@ namespace FirstPersonRTSGame.Engine
         
         private void RenderTerrain(IWorld world, Matrix4x4 viewProj)
         {
-            // Update terrain heights from world
-            UpdateTerrainHeights(world);
+            // Upload terrain heights only when rendering a different world
+            if (!ReferenceEquals(terrainSource, world))
+            {
+                UpdateTerrainHeights(world);
+                terrainSource = world;
+            }
             
             // Use terrain shader
             gl.UseProgram(terrainShader);
@@ -258,6 +273,9 @@ namespace FirstPersonRTSGame.Engine
             // Set view-projection matrix
             gl.UniformMatrix4(viewProjUniformLoc, 1, false, GetMatrix4x4Values(viewProj));
             
+            // Every resource is drawn with the same cube, so bind it once
+            gl.BindVertexArray(cubeVao);
+            
             // Render each resource
             foreach (var resource in resources)
             {
@@ -273,62 +291,55 @@ namespace FirstPersonRTSGame.Engine
                 gl.Uniform4(colorUniformLoc, color.X, color.Y, color.Z, color.W);
                 
                 // Render resource cube
-                gl.BindVertexArray(cubeVao);
                 gl.DrawArrays(PrimitiveType.Triangles, 0, 36);
             }
         }
         
-        private Vector4 GetResourceColor(object resourceType)
+        private Vector4 GetResourceColor(ResourceType type)
         {
-            // Convert resource type to string and determine color
-            if (resourceType is ResourceType type)
+            // Determine color from the type
+            switch (type)
             {
-                switch (type)
-                {
-                    case ResourceType.Wood:
-                        return new Vector4(0.6f, 0.3f, 0.1f, 1.0f); // Brown
-                        
-                    case ResourceType.Iron:
-                        return new Vector4(0.7f, 0.7f, 0.7f, 1.0f); // Silver
-                        
-                    case ResourceType.Gold:
-                        return new Vector4(1.0f, 0.84f, 0.0f, 1.0f); // Gold
-                        
-                    case ResourceType.Crystal:
-                        return new Vector4(0.2f, 0.8f, 0.8f, 1.0f); // Cyan
-                        
-                    case ResourceType.Oil:
-                        return new Vector4(0.1f, 0.1f, 0.1f, 1.0f); // Black
-                        
-                    // New resource types from documentation
-                    case ResourceType.Money:
-                        return new Vector4(0.0f, 0.8f, 0.0f, 1.0f); // Green
-                        
-                    case ResourceType.Cobalt:
-                        return new Vector4(0.0f, 0.0f, 0.8f, 1.0f); // Blue
-                        
-                    case ResourceType.Fuel:
-                        return new Vector4(0.9f, 0.4f, 0.0f, 1.0f); // Orange
-                        
-                    case ResourceType.NuclearWaste:
-                        return new Vector4(0.0f, 0.8f, 0.0f, 1.0f); // Green (toxic)
-                        
-                    case ResourceType.Hydrogen:
-                        return new Vector4(0.8f, 0.8f, 1.0f, 1.0f); // Light blue
-                        
-                    case ResourceType.Ammunition:
-                        return new Vector4(0.5f, 0.5f, 0.2f, 1.0f); // Olive
-                        
-                    case ResourceType.NuclearFuel:
-                        return new Vector4(0.8f, 0.8f, 0.0f, 1.0f); // Yellow
-                        
-                    default:
-                        return new Vector4(1.0f, 1.0f, 1.0f, 1.0f); // White for unknown
-                }
+                case ResourceType.Wood:
+                    return new Vector4(0.6f, 0.3f, 0.1f, 1.0f); // Brown
+                    
+                case ResourceType.Iron:
+                    return new Vector4(0.7f, 0.7f, 0.7f, 1.0f); // Silver
+                    
+                case ResourceType.Gold:
+                    return new Vector4(1.0f, 0.84f, 0.0f, 1.0f); // Gold
+                    
+                case ResourceType.Crystal:
+                    return new Vector4(0.2f, 0.8f, 0.8f, 1.0f); // Cyan
+                    
+                case ResourceType.Oil:
+                    return new Vector4(0.1f, 0.1f, 0.1f, 1.0f); // Black
+                    
+                // New resource types from documentation
+                case ResourceType.Money:
+                    return new Vector4(0.0f, 0.8f, 0.0f, 1.0f); // Green
+                    
+                case ResourceType.Cobalt:
+                    return new Vector4(0.0f, 0.0f, 0.8f, 1.0f); // Blue
+                    
+                case ResourceType.Fuel:
+                    return new Vector4(0.9f, 0.4f, 0.0f, 1.0f); // Orange
+                    
+                case ResourceType.NuclearWaste:
+                    return new Vector4(0.0f, 0.8f, 0.0f, 1.0f); // Green (toxic)
+                    
+                case ResourceType.Hydrogen:
+                    return new Vector4(0.8f, 0.8f, 1.0f, 1.0f); // Light blue
+                    
+                case ResourceType.Ammunition:
+                    return new Vector4(0.5f, 0.5f, 0.2f, 1.0f); // Olive
+                    
+                case ResourceType.NuclearFuel:
+                    return new Vector4(0.8f, 0.8f, 0.0f, 1.0f); // Yellow
+                    
+                default:
+                    return new Vector4(1.0f, 1.0f, 1.0f, 1.0f); // White for unknown
             }
-            
-            // Default color if not a recognized resource type
-            return new Vector4(1.0f, 0.0f, 1.0f, 1.0f); // Magenta for errors
         }
         
         private void RenderBuildings(IEnumerable<IBuilding> buildings, Matrix4x4 viewProj)
@@ -339,6 +350,9 @@ namespace FirstPersonRTSGame.Engine
             // Set view-projection matrix
             gl.UniformMatrix4(viewProjUniformLoc, 1, false, GetMatrix4x4Values(viewProj));
             
+            // Every building is drawn with the same cube, so bind it once
+            gl.BindVertexArray(cubeVao);
+            
             // Render each building
             foreach (var building in buildings)
             {
@@ -357,62 +371,55 @@ namespace FirstPersonRTSGame.Engine
                 gl.Uniform4(colorUniformLoc, color.X, color.Y, color.Z, color.W);
                 
                 // Render building cube
-                gl.BindVertexArray(cubeVao);
                 gl.DrawArrays(PrimitiveType.Triangles, 0, 36);
             }
         }
         
-        private Vector4 GetBuildingColor(object buildingType)
+        private Vector4 GetBuildingColor(BuildingType type)
         {
-            // Convert building type to enum and determine color
-            if (buildingType is BuildingType type)
+            // Determine color from the type
+            switch (type)
             {
-                switch (type)
-                {
-                    case BuildingType.Headquarters:
-                        return new Vector4(0.2f, 0.6f, 0.9f, 1.0f); // Blue
-                        
-                    case BuildingType.Shipyard:
-                        return new Vector4(0.9f, 0.6f, 0.2f, 1.0f); // Orange
-                        
-                    case BuildingType.Workshop:
-                        return new Vector4(0.7f, 0.7f, 0.2f, 1.0f); // Yellow
-                        
-                    case BuildingType.Mine:
-                        return new Vector4(0.5f, 0.5f, 0.5f, 1.0f); // Gray
-                        
-                    case BuildingType.Refinery:
-                        return new Vector4(0.8f, 0.2f, 0.2f, 1.0f); // Red
-                        
-                    case BuildingType.OilRig:
-                        return new Vector4(0.3f, 0.3f, 0.3f, 1.0f); // Dark Gray
-                        
-                    case BuildingType.Laboratory:
-                        return new Vector4(0.8f, 0.2f, 0.8f, 1.0f); // Purple
-                        
-                    // New building types from documentation
-                    case BuildingType.Market:
-                        return new Vector4(0.0f, 0.8f, 0.0f, 1.0f); // Green
-                        
-                    case BuildingType.CobaltEnrichment:
-                        return new Vector4(0.0f, 0.0f, 0.8f, 1.0f); // Blue
-                        
-                    case BuildingType.NuclearRecycler:
-                        return new Vector4(0.8f, 0.8f, 0.0f, 1.0f); // Yellow
-                        
-                    case BuildingType.Electrolysis:
-                        return new Vector4(0.8f, 0.8f, 1.0f, 1.0f); // Light blue
-                        
-                    case BuildingType.OilPlatform:
-                        return new Vector4(0.3f, 0.3f, 0.3f, 1.0f); // Dark Gray
-                        
-                    default:
-                        return new Vector4(1.0f, 1.0f, 1.0f, 1.0f); // White for unknown
-                }
+                case BuildingType.Headquarters:
+                    return new Vector4(0.2f, 0.6f, 0.9f, 1.0f); // Blue
+                    
+                case BuildingType.Shipyard:
+                    return new Vector4(0.9f, 0.6f, 0.2f, 1.0f); // Orange
+                    
+                case BuildingType.Workshop:
+                    return new Vector4(0.7f, 0.7f, 0.2f, 1.0f); // Yellow
+                    
+                case BuildingType.Mine:
+                    return new Vector4(0.5f, 0.5f, 0.5f, 1.0f); // Gray
+                    
+                case BuildingType.Refinery:
+                    return new Vector4(0.8f, 0.2f, 0.2f, 1.0f); // Red
+                    
+                case BuildingType.OilRig:
+                    return new Vector4(0.3f, 0.3f, 0.3f, 1.0f); // Dark Gray
+                    
+                case BuildingType.Laboratory:
+                    return new Vector4(0.8f, 0.2f, 0.8f, 1.0f); // Purple
+                    
+                // New building types from documentation
+                case BuildingType.Market:
+                    return new Vector4(0.0f, 0.8f, 0.0f, 1.0f); // Green
+                    
+                case BuildingType.CobaltEnrichment:
+                    return new Vector4(0.0f, 0.0f, 0.8f, 1.0f); // Blue
+                    
+                case BuildingType.NuclearRecycler:
+                    return new Vector4(0.8f, 0.8f, 0.0f, 1.0f); // Yellow
+                    
+                case BuildingType.Electrolysis:
+                    return new Vector4(0.8f, 0.8f, 1.0f, 1.0f); // Light blue
+                    
+                case BuildingType.OilPlatform:
+                    return new Vector4(0.3f, 0.3f, 0.3f, 1.0f); // Dark Gray
+                    
+                default:
+                    return new Vector4(1.0f, 1.0f, 1.0f, 1.0f); // White for unknown
             }
-            
-            // Default color if not a recognized building type
-            return new Vector4(1.0f, 0.0f, 1.0f, 1.0f); // Magenta for errors
         }
         
         private void RenderShips(IEnumerable<IShip> ships, Matrix4x4 viewProj)
@@ -423,6 +430,9 @@ namespace FirstPersonRTSGame.Engine
             // Set view-projection matrix
             gl.UniformMatrix4(viewProjUniformLoc, 1, false, GetMatrix4x4Values(viewProj));
             
+            // Every ship is drawn with the same cube, so bind it once
+            gl.BindVertexArray(cubeVao);
+            
             // Render each ship
             foreach (var ship in ships)
             {
@@ -439,50 +449,43 @@ namespace FirstPersonRTSGame.Engine
                 gl.Uniform4(colorUniformLoc, color.X, color.Y, color.Z, color.W);
                 
                 // Render ship cube
-                gl.BindVertexArray(cubeVao);
                 gl.DrawArrays(PrimitiveType.Triangles, 0, 36);
             }
         }
         
-        private Vector4 GetShipColor(object shipType)
+        private Vector4 GetShipColor(ShipType type)
         {
-            // Convert ship type to enum and determine color
-            if (shipType is ShipType type)
+            // Determine color from the type
+            switch (type)
             {
-                switch (type)
-                {
-                    case ShipType.Harvester:
-                        return new Vector4(0.2f, 0.8f, 0.3f, 1.0f); // Green
-                        
-                    case ShipType.Scout:
-                        return new Vector4(0.8f, 0.8f, 0.2f, 1.0f); // Yellow
-                        
-                    case ShipType.Cruiser:
-                        return new Vector4(0.8f, 0.2f, 0.2f, 1.0f); // Red
-                        
-                    case ShipType.Transport:
-                        return new Vector4(0.5f, 0.5f, 0.8f, 1.0f); // Light Blue
-                        
-                    // New ship types from documentation
-                    case ShipType.MarketTransporter:
-                        return new Vector4(0.0f, 0.8f, 0.0f, 1.0f); // Green
-                        
-                    case ShipType.AmmunitionShip:
-                        return new Vector4(0.5f, 0.5f, 0.2f, 1.0f); // Olive
-                        
-                    case ShipType.NuclearFreighter:
-                        return new Vector4(0.8f, 0.8f, 0.0f, 1.0f); // Yellow
-                        
-                    case ShipType.WarShip:
-                        return new Vector4(0.9f, 0.2f, 0.2f, 1.0f); // Red
-                        
-                    default:
-                        return new Vector4(1.0f, 1.0f, 1.0f, 1.0f); // White for unknown
-                }
+                case ShipType.Harvester:
+                    return new Vector4(0.2f, 0.8f, 0.3f, 1.0f); // Green
+                    
+                case ShipType.Scout:
+                    return new Vector4(0.8f, 0.8f, 0.2f, 1.0f); // Yellow
+                    
+                case ShipType.Cruiser:
+                    return new Vector4(0.8f, 0.2f, 0.2f, 1.0f); // Red
+                    
+                case ShipType.Transport:
+                    return new Vector4(0.5f, 0.5f, 0.8f, 1.0f); // Light Blue
+                    
+                // New ship types from documentation
+                case ShipType.MarketTransporter:
+                    return new Vector4(0.0f, 0.8f, 0.0f, 1.0f); // Green
+                    
+                case ShipType.AmmunitionShip:
+                    return new Vector4(0.5f, 0.5f, 0.2f, 1.0f); // Olive
+                    
+                case ShipType.NuclearFreighter:
+                    return new Vector4(0.8f, 0.8f, 0.0f, 1.0f); // Yellow
+                    
+                case ShipType.WarShip:
+                    return new Vector4(0.9f, 0.2f, 0.2f, 1.0f); // Red
+                    
+                default:
+                    return new Vector4(1.0f, 1.0f, 1.0f, 1.0f); // White for unknown
             }
-            
-            // Default color if not a recognized ship type
-            return new Vector4(1.0f, 0.0f, 1.0f, 1.0f); // Magenta for errors
         }
         
         private void InitializeShaders()
@@ -0,0 +1,244 @@
+using System;
+using System.Collections.Generic;
+using System.Numerics;
+
+namespace FirstPersonRTSGame.Engine
+{
+    /// <summary>
+    /// Range lookup over objects placed on the XZ plane.
+    /// Implementations are rebuilt in bulk whenever the underlying collection changes.
+    /// </summary>
+    /// <typeparam name="T">The type of object stored in the index.</typeparam>
+    public interface ISpatialIndex<T> where T : class
+    {
+        /// <summary>
+        /// Number of objects currently stored in the index.
+        /// </summary>
+        int Count { get; }
+        
+        /// <summary>
+        /// Replaces the contents of the index with the given objects.
+        /// </summary>
+        /// <param name="items">The objects to index.</param>
+        void Rebuild(IReadOnlyList<T> items);
+        
+        /// <summary>
+        /// Collects every object within a radius of a position on the XZ plane.
+        /// </summary>
+        /// <param name="position">The query position (Y is ignored).</param>
+        /// <param name="radius">Search radius.</param>
+        /// <param name="results">List the matching objects are appended to.</param>
+        void FindInRange(Vector3 position, float radius, List<T> results);
+    }
+    
+    /// <summary>
+    /// Spatial index that buckets objects into a uniform grid of square cells.
+    /// Works best when objects are spread fairly evenly over the map.
+    /// </summary>
+    /// <typeparam name="T">The type of object stored in the index.</typeparam>
+    public sealed class GridSpatialIndex<T> : ISpatialIndex<T> where T : class
+    {
+        private readonly Func<T, Vector3> positionSelector;
+        private readonly float inverseCellSize;
+        
+        // Cells keyed by packed (x, z) cell coordinates
+        private readonly Dictionary<long, List<T>> cells = new Dictionary<long, List<T>>();
+        
+        // Extent of occupied cells, used to bound the search
+        private int minCellX;
+        private int maxCellX;
+        private int minCellZ;
+        private int maxCellZ;
+        
+        public int Count { get; private set; }
+        
+        public GridSpatialIndex(Func<T, Vector3> positionSelector, float cellSize)
+        {
+            if (cellSize <= 0)
+                throw new ArgumentOutOfRangeException(nameof(cellSize), "Cell size must be positive");
+            
+            this.positionSelector = positionSelector;
+            inverseCellSize = 1.0f / cellSize;
+        }
+        
+        public void Rebuild(IReadOnlyList<T> items)
+        {
+            // Keep the cell lists around so rebuilding doesn't reallocate them
+            foreach (var cell in cells.Values)
+            {
+                cell.Clear();
+            }
+            
+            minCellX = int.MaxValue;
+            maxCellX = int.MinValue;
+            minCellZ = int.MaxValue;
+            maxCellZ = int.MinValue;
+            
+            for (int i = 0; i < items.Count; i++)
+            {
+                T item = items[i];
+                Vector3 position = positionSelector(item);
+                int cellX = GetCellCoordinate(position.X);
+                int cellZ = GetCellCoordinate(position.Z);
+                
+                long key = GetCellKey(cellX, cellZ);
+                if (!cells.TryGetValue(key, out List<T>? cell))
+                {
+                    cell = new List<T>();
+                    cells[key] = cell;
+                }
+                
+                cell.Add(item);
+                
+                minCellX = Math.Min(minCellX, cellX);
+                maxCellX = Math.Max(maxCellX, cellX);
+                minCellZ = Math.Min(minCellZ, cellZ);
+                maxCellZ = Math.Max(maxCellZ, cellZ);
+            }
+            
+            Count = items.Count;
+        }
+        
+        public void FindInRange(Vector3 position, float radius, List<T> results)
+        {
+            if (Count == 0)
+                return;
+            
+            float radiusSquared = radius * radius;
+            
+            // Clamp the searched cell range to the occupied part of the grid
+            int startX = Math.Max(GetCellCoordinate(position.X - radius), minCellX);
+            int endX = Math.Min(GetCellCoordinate(position.X + radius), maxCellX);
+            int startZ = Math.Max(GetCellCoordinate(position.Z - radius), minCellZ);
+            int endZ = Math.Min(GetCellCoordinate(position.Z + radius), maxCellZ);
+            
+            for (int cellZ = startZ; cellZ <= endZ; cellZ++)
+            {
+                for (int cellX = startX; cellX <= endX; cellX++)
+                {
+                    if (!cells.TryGetValue(GetCellKey(cellX, cellZ), out List<T>? cell))
+                        continue;
+                    
+                    for (int i = 0; i < cell.Count; i++)
+                    {
+                        Vector3 itemPosition = positionSelector(cell[i]);
+                        float dx = itemPosition.X - position.X;
+                        float dz = itemPosition.Z - position.Z;
+                        
+                        if (dx * dx + dz * dz <= radiusSquared)
+                        {
+                            results.Add(cell[i]);
+                        }
+                    }
+                }
+            }
+        }
+        
+        private int GetCellCoordinate(float value)
+        {
+            return (int)Math.Floor(value * inverseCellSize);
+        }
+        
+        private static long GetCellKey(int cellX, int cellZ)
+        {
+            return ((long)cellX << 32) | (uint)cellZ;
+        }
+    }
+    
+    /// <summary>
+    /// Spatial index that checks every object, keeping positions in flat X and Z arrays
+    /// so distances can be computed several at a time with SIMD.
+    /// Cheaper than a grid for small collections.
+    /// </summary>
+    /// <typeparam name="T">The type of object stored in the index.</typeparam>
+    public sealed class LinearSpatialIndex<T> : ISpatialIndex<T> where T : class
+    {
+        private readonly Func<T, Vector3> positionSelector;
+        
+        // Objects and their positions, stored as parallel arrays
+        private T[] items = Array.Empty<T>();
+        private float[] xs = Array.Empty<float>();
+        private float[] zs = Array.Empty<float>();
+        
+        // Scratch buffer for the squared distances of the last query
+        private float[] distancesSquared = Array.Empty<float>();
+        
+        public int Count { get; private set; }
+        
+        public LinearSpatialIndex(Func<T, Vector3> positionSelector)
+        {
+            this.positionSelector = positionSelector;
+        }
+        
+        public void Rebuild(IReadOnlyList<T> source)
+        {
+            if (items.Length < source.Count)
+            {
+                items = new T[source.Count];
+                xs = new float[source.Count];
+                zs = new float[source.Count];
+                distancesSquared = new float[source.Count];
+            }
+            else
+            {
+                // Don't keep removed objects alive through stale slots
+                Array.Clear(items, source.Count, items.Length - source.Count);
+            }
+            
+            for (int i = 0; i < source.Count; i++)
+            {
+                Vector3 position = positionSelector(source[i]);
+                items[i] = source[i];
+                xs[i] = position.X;
+                zs[i] = position.Z;
+            }
+            
+            Count = source.Count;
+        }
+        
+        public void FindInRange(Vector3 position, float radius, List<T> results)
+        {
+            if (Count == 0)
+                return;
+            
+            ComputeDistancesSquared(position);
+            
+            float radiusSquared = radius * radius;
+            for (int i = 0; i < Count; i++)
+            {
+                if (distancesSquared[i] <= radiusSquared)
+                {
+                    results.Add(items[i]);
+                }
+            }
+        }
+        
+        private void ComputeDistancesSquared(Vector3 position)
+        {
+            int i = 0;
+            
+            if (Vector.IsHardwareAccelerated)
+            {
+                // Process as many objects per instruction as the hardware allows
+                int width = Vector<float>.Count;
+                var px = new Vector<float>(position.X);
+                var pz = new Vector<float>(position.Z);
+                
+                for (; i <= Count - width; i += width)
+                {
+                    Vector<float> dx = new Vector<float>(xs, i) - px;
+                    Vector<float> dz = new Vector<float>(zs, i) - pz;
+                    (dx * dx + dz * dz).CopyTo(distancesSquared, i);
+                }
+            }
+            
+            // Remaining objects that don't fill a whole vector
+            for (; i < Count; i++)
+            {
+                float dx = xs[i] - position.X;
+                float dz = zs[i] - position.Z;
+                distancesSquared[i] = dx * dx + dz * dz;
+            }
+        }
+    }
+} 
\ No newline at end of file
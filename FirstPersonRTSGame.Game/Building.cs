@@ -5,20 +5,20 @@ using FirstPersonRTSGame.Engine;
 
 namespace FirstPersonRTSGame.Game
 {
-    public class Building : IBuilding, IDisposable
+    public sealed class Building : IBuilding, IDisposable
     {
-        private Vector3 position;
-        private FirstPersonRTSGame.Engine.BuildingType type;
+        private readonly Vector3 position;
+        private readonly FirstPersonRTSGame.Engine.BuildingType type;
         private float health;
-        private float maxHealth;
+        private readonly float maxHealth;
         private bool isActive;
         private float constructionProgress;
         
         // Production properties
-        private Dictionary<FirstPersonRTSGame.Engine.ResourceType, int> inventory;
-        private FirstPersonRTSGame.Engine.ResourceType? productionInput;
-        private FirstPersonRTSGame.Engine.ResourceType? productionOutput;
-        private float productionRate;
+        private readonly Dictionary<FirstPersonRTSGame.Engine.ResourceType, int> inventory;
+        private readonly FirstPersonRTSGame.Engine.ResourceType? productionInput;
+        private readonly FirstPersonRTSGame.Engine.ResourceType? productionOutput;
+        private readonly float productionRate;
         private float productionTimer;
         
         public Vector3 Position => position;
@@ -9,11 +9,16 @@ using Silk.NET.Maths;
 
 namespace FirstPersonRTSGame.Game
 {
-    public class Game
+    public sealed class Game
     {
         // Window and input
-        private IWindow window;
+        private readonly IWindow window;
         private IInputContext? input;
+        private IKeyboard? keyboard;
+        
+        // Movement keys in the order Player.Update takes them, polled once per frame
+        private static readonly Key[] MovementKeys = { Key.W, Key.S, Key.A, Key.D, Key.Space, Key.ShiftLeft };
+        private readonly bool[] movementInput = new bool[MovementKeys.Length];
         
         // Game components
         private GL? gl;
@@ -28,12 +33,22 @@ namespace FirstPersonRTSGame.Game
         private UIManager? uiManager;
         
         // UI state
-        private bool showInventory = false;
-        private bool showBuildingMenu = false;
+        private bool highReadabilityEnabled = false;
         
         // Delta time tracking
         private float deltaTime;
-        private double lastFrameTime;
+        
+        // Latest mouse position reported since the last update; mouse move events
+        // are coalesced and applied to the camera once per frame
+        private Vector2 mousePosition;
+        private bool mouseMoved;
+        
+        // Fixed timestep simulation
+        private float accumulator;
+        private float interpolationAlpha;
+        
+        // Paces the loop when VSync is off; with VSync on, the buffer swap already does
+        private FrameLimiter? frameLimiter;
         
         public Game()
         {
@@ -52,6 +67,7 @@ namespace FirstPersonRTSGame.Game
             window.Render += OnRender;
             window.Closing += OnClose;
             window.Resize += OnResize;
+            window.StateChanged += OnStateChanged;
         }
         
         public void Run()
@@ -75,6 +91,9 @@ namespace FirstPersonRTSGame.Game
                 input.Keyboards[i].KeyDown += OnKeyDown;
             }
             
+            // Movement is polled from the primary keyboard every frame
+            keyboard = input.Keyboards.Count > 0 ? input.Keyboards[0] : null;
+            
             for (int i = 0; i < input.Mice.Count; i++)
             {
                 input.Mice[i].MouseMove += OnMouseMove;
@@ -85,6 +104,12 @@ namespace FirstPersonRTSGame.Game
                 input.Mice[i].Cursor.IsConfined = true;
             }
             
+            // From here on the position is tracked from mouse move events
+            if (input.Mice.Count > 0)
+            {
+                mousePosition = input.Mice[0].Position;
+            }
+            
             // Initialize rendering systems
             uiRenderer = new UIRenderer(gl, window.Size.X, window.Size.Y);
             textRenderer = new TextRenderer(gl); 
@@ -103,12 +128,16 @@ namespace FirstPersonRTSGame.Game
             // Set up renderer
             renderer = new Renderer(gl);
             
-            // Set initial frame time
-            lastFrameTime = window.Time;
-            
             // Show accessibility notification
             uiManager.ShowNotification("Press F2 to toggle high readability font mode", NotificationType.Info, 5.0f);
             
+            // Without VSync, cap the frame rate at the monitor's refresh rate
+            if (!window.VSync)
+            {
+                int refreshRate = window.Monitor?.VideoMode.RefreshRate ?? 0;
+                frameLimiter = new FrameLimiter(refreshRate > 0 ? refreshRate : Constants.MaxFramesPerSecond);
+            }
+            
             // Set up OpenGL state
             gl.Enable(EnableCap.DepthTest);
             gl.ClearColor(0.5f, 0.8f, 1.0f, 1.0f); // Sky blue
@@ -118,32 +147,34 @@ namespace FirstPersonRTSGame.Game
         
         private void OnUpdate(double deltaTime)
         {
-            this.deltaTime = (float)deltaTime;
+            // Sleep off the rest of the frame before sampling input, so the wait doesn't
+            // delay a frame that has already been drawn
+            frameLimiter?.Wait();
+            
+            // Clamp long frames (e.g. after a hitch) so the simulation doesn't spiral trying to catch up
+            this.deltaTime = Math.Min((float)deltaTime, Constants.MaxFrameTime);
             
-            // Update player
-            if (player != null && input != null)
+            // Apply all mouse movement since the last frame in one go
+            if (mouseMoved && player != null)
             {
-                // Check for keyboard input
-                var keyboard = input.Keyboards[0];
-                
-                // Movement keys
-                bool moveForward = keyboard.IsKeyPressed(Key.W);
-                bool moveBackward = keyboard.IsKeyPressed(Key.S);
-                bool moveLeft = keyboard.IsKeyPressed(Key.A);
-                bool moveRight = keyboard.IsKeyPressed(Key.D);
-                bool moveUp = keyboard.IsKeyPressed(Key.Space);
-                bool moveDown = keyboard.IsKeyPressed(Key.ShiftLeft);
-                
-                // Update player based on input
-                player.Update(this.deltaTime, moveForward, moveBackward, moveLeft, moveRight, moveUp, moveDown);
+                player.OnMouseMove(mousePosition.X, mousePosition.Y);
+                mouseMoved = false;
             }
             
-            // Update world
-            if (world != null)
+            // Poll input before stepping the simulation so it affects this frame
+            PollMovementInput();
+            
+            // Step the simulation in fixed increments so it runs the same at any frame rate
+            accumulator += this.deltaTime;
+            while (accumulator >= Constants.FixedDeltaTime)
             {
-                world.Update(this.deltaTime);
+                FixedUpdate(Constants.FixedDeltaTime);
+                accumulator -= Constants.FixedDeltaTime;
             }
             
+            // Fraction of a step left over, used to smooth the camera between steps
+            interpolationAlpha = accumulator / Constants.FixedDeltaTime;
+            
             // Update renderer
             if (renderer != null)
             {
@@ -154,38 +185,47 @@ namespace FirstPersonRTSGame.Game
             UpdateUI();
         }
         
-        private void UpdateUI()
+        private void PollMovementInput()
         {
-            // Update UI visibility based on input
-            if (input != null)
+            for (int i = 0; i < MovementKeys.Length; i++)
             {
-                var keyboard = input.Keyboards[0];
-                
-                if (keyboard.IsKeyPressed(Key.Tab))
-                {
-                    uiManager?.ToggleInventory();
-                }
-                
-                if (keyboard.IsKeyPressed(Key.B))
-                {
-                    uiManager?.ToggleBuildingMenu();
-                }
-                
-                if (keyboard.IsKeyPressed(Key.F1))
-                {
-                    uiManager?.ToggleHelp();
-                }
+                movementInput[i] = keyboard != null && keyboard.IsKeyPressed(MovementKeys[i]);
+            }
+        }
+        
+        private void FixedUpdate(float fixedDeltaTime)
+        {
+            // Update player based on input (forward, backward, left, right, up, down)
+            if (player != null)
+            {
+                player.Update(fixedDeltaTime, movementInput[0], movementInput[1], movementInput[2],
+                              movementInput[3], movementInput[4], movementInput[5]);
             }
             
-            // Update UI manager
+            // Update world
+            if (world != null)
+            {
+                world.Update(fixedDeltaTime);
+            }
+        }
+        
+        private void UpdateUI()
+        {
+            // UI panels are toggled from OnKeyDown
+            
+            // Update UI manager; the cursor is handed over once per rendered frame in RenderUI
             if (player != null && world != null && uiManager != null)
             {
-                uiManager.Update(player, world, input?.Mice[0].Position ?? Vector2.Zero, deltaTime);
+                uiManager.Update(player, world, deltaTime);
             }
         }
         
         private void OnRender(double obj)
         {
+            // Nothing is visible while minimized
+            if (window.WindowState == WindowState.Minimized)
+                return;
+            
             // Clear the screen
             if (gl != null)
             {
@@ -195,7 +235,7 @@ namespace FirstPersonRTSGame.Game
             // Render the game world
             if (renderer != null && world != null && player != null)
             {
-                renderer.Render(world, player);
+                renderer.Render(world, player, player.GetInterpolatedPosition(interpolationAlpha));
                 
                 // Render UI
                 RenderUI();
@@ -204,20 +244,31 @@ namespace FirstPersonRTSGame.Game
         
         private void RenderUI()
         {
+            // Read the fields once rather than null-checking each of them per call
+            var gl = this.gl;
+            var uiManager = this.uiManager;
+            if (gl == null || uiManager == null || player == null || world == null) return;
+            
             // Enable blending for UI
-            gl?.Enable(EnableCap.Blend);
-            gl?.BlendFunc(BlendingFactor.SrcAlpha, BlendingFactor.OneMinusSrcAlpha);
-            gl?.Disable(EnableCap.DepthTest);
+            gl.Enable(EnableCap.Blend);
+            gl.BlendFunc(BlendingFactor.SrcAlpha, BlendingFactor.OneMinusSrcAlpha);
+            gl.Disable(EnableCap.DepthTest);
             
             // Render UI using UI Manager
-            if (player != null && world != null && uiManager != null)
+            uiManager.Render(player, world);
+            
+            // Hit-test the cursor against this frame's buttons once per rendered frame, using
+            // the latest position from the mouse move events, however many arrived. A locked
+            // (raw) cursor reports an unbounded virtual position rather than screen pixels.
+            if (uiManager.IsAnyPanelOpen && input != null && input.Mice.Count > 0 &&
+                input.Mice[0].Cursor.CursorMode == CursorMode.Normal)
             {
-                uiManager.Render(player, world);
+                uiManager.HandleMouseMove(mousePosition.X, mousePosition.Y);
             }
             
             // Restore GL state
-            gl?.Enable(EnableCap.DepthTest);
-            gl?.Disable(EnableCap.Blend);
+            gl.Enable(EnableCap.DepthTest);
+            gl.Disable(EnableCap.Blend);
         }
         
         private void OnClose()
@@ -255,14 +306,21 @@ namespace FirstPersonRTSGame.Game
             }
         }
         
+        private void OnStateChanged(WindowState state)
+        {
+            // While minimized, block until the next window event instead of running the
+            // loop at full rate. The simulation clamps the long first frame on restore.
+            window.IsEventDriven = state == WindowState.Minimized;
+        }
+        
         private void OnMouseMove(IMouse mouse, Vector2 position)
         {
-            // Only handle mouse movement if the window has focus
-            // Mouse movement used for camera rotation
-            if (player != null)
-            {
-                player.OnMouseMove(position.X, position.Y);
-            }
+            // Mouse movement used for camera rotation. High polling rate mice can report
+            // many moves per frame, so only remember the latest position here and let
+            // OnUpdate apply it. The player works from absolute positions, so the
+            // accumulated offset is the same as applying every event.
+            mousePosition = position;
+            mouseMoved = true;
         }
         
         private void OnMouseScroll(IMouse mouse, ScrollWheel scrollWheel)
@@ -283,6 +341,7 @@ namespace FirstPersonRTSGame.Game
             switch (key)
             {
                 case Key.I:
+                case Key.Tab:
                     uiManager.ToggleInventory();
                     break;
                     
@@ -295,49 +354,12 @@ namespace FirstPersonRTSGame.Game
                     break;
                     
                 case Key.Escape:
-                    // Toggle mouse cursor lock
-                    if (input != null && input.Mice.Count > 0)
-                    {
-                        var mouse = input.Mice[0];
-                        if (mouse.Cursor.CursorMode == CursorMode.Raw)
-                        {
-                            // Unlock cursor
-                            mouse.Cursor.CursorMode = CursorMode.Normal;
-                            mouse.Cursor.IsConfined = false;
-                        }
-                        else
-                        {
-                            // Lock cursor
-                            mouse.Cursor.CursorMode = CursorMode.Raw;
-                            mouse.Cursor.IsConfined = true;
-                        }
-                    }
+                    ToggleCursorLock();
                     break;
                     
                 // Add a font accessibility option - F2 toggles improved font readability
                 case Key.F2:
-                    // Toggle between normal and high readability font settings
-                    if (textRenderer != null)
-                    {
-                        // Static variable to track state
-                        bool highReadabilityEnabled = false;
-                        
-                        // Toggle state
-                        highReadabilityEnabled = !highReadabilityEnabled;
-                        
-                        if (highReadabilityEnabled)
-                        {
-                            // Enable high readability mode
-                            uiManager.IncreaseFontReadability();
-                            uiManager.ShowNotification("High readability font enabled", NotificationType.Info);
-                        }
-                        else
-                        {
-                            // Reset to default font settings
-                            uiManager.AdjustFontSettings(16, false);
-                            uiManager.ShowNotification("Default font enabled", NotificationType.Info);
-                        }
-                    }
+                    ToggleFontReadability();
                     break;
                     
                 // Handle ship commands with number keys
@@ -372,6 +394,46 @@ namespace FirstPersonRTSGame.Game
             }
         }
         
+        private void ToggleCursorLock()
+        {
+            if (input == null || input.Mice.Count == 0) return;
+            
+            var mouse = input.Mice[0];
+            if (mouse.Cursor.CursorMode == CursorMode.Raw)
+            {
+                // Unlock cursor
+                mouse.Cursor.CursorMode = CursorMode.Normal;
+                mouse.Cursor.IsConfined = false;
+            }
+            else
+            {
+                // Lock cursor
+                mouse.Cursor.CursorMode = CursorMode.Raw;
+                mouse.Cursor.IsConfined = true;
+            }
+        }
+        
+        private void ToggleFontReadability()
+        {
+            // Toggle between normal and high readability font settings
+            if (textRenderer == null || uiManager == null) return;
+            
+            highReadabilityEnabled = !highReadabilityEnabled;
+            
+            if (highReadabilityEnabled)
+            {
+                // Enable high readability mode
+                uiManager.IncreaseFontReadability();
+                uiManager.ShowNotification("High readability font enabled", NotificationType.Info);
+            }
+            else
+            {
+                // Reset to default font settings
+                uiManager.AdjustFontSettings(16, false);
+                uiManager.ShowNotification("Default font enabled", NotificationType.Info);
+            }
+        }
+        
         private void CommandShipToHarvest(ResourceType resourceType)
         {
             if (player != null)
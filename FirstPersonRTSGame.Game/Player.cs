@@ -5,9 +5,10 @@ using FirstPersonRTSGame.Engine;
 
 namespace FirstPersonRTSGame.Game
 {
-    public class Player : IPlayer
+    public sealed class Player : IPlayer
     {
         private Vector3 position;
+        private Vector3 previousPosition; // Position before the last update, for render interpolation
         private Vector3 velocity;
         private float yaw;
         private float pitch;
@@ -28,11 +29,14 @@ namespace FirstPersonRTSGame.Game
         private IBuilding? targetedBuilding;
         private IShip? targetedShip;
         
+        // Buildings close enough to be targeted, reused between frames
+        private readonly List<Building> nearbyBuildings = new List<Building>();
+        
         // World reference
         private World? world;
         
         // Inventory
-        private Dictionary<FirstPersonRTSGame.Engine.ResourceType, int> inventory = new Dictionary<FirstPersonRTSGame.Engine.ResourceType, int>();
+        private readonly Dictionary<FirstPersonRTSGame.Engine.ResourceType, int> inventory = new Dictionary<FirstPersonRTSGame.Engine.ResourceType, int>();
         
         // Mouse handling
         private float lastX;
@@ -50,6 +54,7 @@ namespace FirstPersonRTSGame.Game
         {
             // Initialize position
             position = startPosition;
+            previousPosition = startPosition;
             velocity = Vector3.Zero;
             
             // Initialize orientation
@@ -80,6 +85,8 @@ namespace FirstPersonRTSGame.Game
         
         public void Update(float deltaTime, bool moveForward, bool moveBackward, bool moveLeft, bool moveRight, bool moveUp, bool moveDown)
         {
+            previousPosition = position;
+            
             // Calculate movement direction based on input
             Vector3 moveDirection = Vector3.Zero;
             
@@ -122,6 +129,12 @@ namespace FirstPersonRTSGame.Game
             UpdateInteractions();
         }
         
+        // Position blended between the last two updates (alpha 0 = previous, 1 = current)
+        public Vector3 GetInterpolatedPosition(float alpha)
+        {
+            return Vector3.Lerp(previousPosition, position, alpha);
+        }
+        
         public void OnMouseMove(float mouseX, float mouseY)
         {
             // Check if this is the first mouse input
@@ -208,8 +221,12 @@ namespace FirstPersonRTSGame.Game
                 }
             }
             
-            // Check for buildings in line of sight
-            foreach (var building in world.Buildings)
+            // Check for buildings in line of sight, only testing those close enough to be hit.
+            // The extra 3 units covers the building's bounding box around its center.
+            nearbyBuildings.Clear();
+            world.GetBuildingsInRange(position, InteractionDistance + 3.0f, nearbyBuildings);
+            
+            foreach (var building in nearbyBuildings)
             {
                 if (RayIntersectsBox(rayOrigin, rayDirection, building.Position, new Vector3(3, 3, 3), out float distance))
                 {
@@ -7,21 +7,21 @@ namespace FirstPersonRTSGame.Game
     // ResourceType enum has been moved to Engine namespace
     // using FirstPersonRTSGame.Engine.ResourceType instead
     
-    public class Resource : IResource
+    public sealed class Resource : IResource
     {
         // Resource properties
-        private Vector3 position;
-        private FirstPersonRTSGame.Engine.ResourceType type;
+        private readonly Vector3 position;
+        private readonly FirstPersonRTSGame.Engine.ResourceType type;
         private int amount;
-        private Guid id;
+        private readonly Guid id;
         
         // Visual properties
         private float visualScale = 1.0f;
         
         // Regeneration properties (some resources regrow over time)
-        private bool canRegenerate;
-        private float regenerationRate;
-        private int maxAmount;
+        private readonly bool canRegenerate;
+        private readonly float regenerationRate;
+        private readonly int maxAmount;
         private float regenerationTimer;
         
         // Interface implementation properties
@@ -15,19 +15,19 @@ namespace FirstPersonRTSGame.Game
         ReturnToPosition
     }
     
-    public class Ship : IShip
+    public sealed class Ship : IShip
     {
         // Ship properties
         private Vector3 position;
         private Vector3 rotation;
-        private float speed;
+        private readonly float speed;
         private float health;
-        private float maxHealth;
-        private FirstPersonRTSGame.Engine.ShipType type;
+        private readonly float maxHealth;
+        private readonly FirstPersonRTSGame.Engine.ShipType type;
         
         // Cargo
-        private Dictionary<FirstPersonRTSGame.Engine.ResourceType, int> cargo = new Dictionary<FirstPersonRTSGame.Engine.ResourceType, int>();
-        private int maxCargoCapacity;
+        private readonly Dictionary<FirstPersonRTSGame.Engine.ResourceType, int> cargo = new Dictionary<FirstPersonRTSGame.Engine.ResourceType, int>();
+        private readonly int maxCargoCapacity;
         private int currentCargoAmount;
         
         // Target information
@@ -40,7 +40,7 @@ namespace FirstPersonRTSGame.Game
         private IBuilding? dropoffBuilding;
         private Vector3 homePosition;
         private float actionTimer;
-        private float harvestingRate = 5.0f; // Units per second
+        private readonly float harvestingRate = 5.0f; // Units per second
         private FirstPersonRTSGame.Engine.ResourceType preferredResourceType = FirstPersonRTSGame.Engine.ResourceType.Wood;
         
         // World reference for autonomous behavior
@@ -186,7 +186,7 @@ namespace FirstPersonRTSGame.Game
                 direction.Y = 0;
                 
                 // Check if we're close enough to target
-                if (direction.Length() < 0.5f)
+                if (direction.LengthSquared() < 0.5f * 0.5f)
                 {
                     // We've reached the target
                     isMoving = false;
@@ -419,17 +419,17 @@ namespace FirstPersonRTSGame.Game
             if (world == null) return;
             
             // Find a dropoff building
-            float closestDistance = float.MaxValue;
+            float closestDistanceSquared = float.MaxValue;
             dropoffBuilding = null;
             
             foreach (var building in world.Buildings)
             {
                 if (building.Type == FirstPersonRTSGame.Engine.BuildingType.Headquarters || building.Type == FirstPersonRTSGame.Engine.BuildingType.Shipyard)
                 {
-                    float distance = Vector3.Distance(position, building.Position);
-                    if (distance < closestDistance)
+                    float distanceSquared = Vector3.DistanceSquared(position, building.Position);
+                    if (distanceSquared < closestDistanceSquared)
                     {
-                        closestDistance = distance;
+                        closestDistanceSquared = distanceSquared;
                         dropoffBuilding = building;
                     }
                 }
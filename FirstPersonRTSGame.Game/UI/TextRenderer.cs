@@ -22,6 +22,10 @@ namespace FirstPersonRTSGame.Game.UI
         private uint vao;
         private uint vbo;
         
+        // Uniform locations, looked up once after linking
+        private int projectionLocation;
+        private int colorLocation;
+        
         // Texture atlas
         private uint texture;
         private Dictionary<char, CharInfo> characters = new Dictionary<char, CharInfo>();
@@ -123,6 +127,9 @@ namespace FirstPersonRTSGame.Game.UI
             int textureLocation = gl.GetUniformLocation(shader, "text");
             gl.Uniform1(textureLocation, 0); // Set text sampler to texture unit 0
             gl.UseProgram(0);
+            
+            projectionLocation = gl.GetUniformLocation(shader, "projection");
+            colorLocation = gl.GetUniformLocation(shader, "textColor");
         }
         
         private unsafe void GenerateFontAtlas()
@@ -898,29 +905,12 @@ namespace FirstPersonRTSGame.Game.UI
             // Bind shader
             gl.UseProgram(shader);
             
-            // Set uniforms
-            int projLocation = gl.GetUniformLocation(shader, "projection");
-            
-            // Convert Matrix4x4 to float array
-            float[] matrixData = new float[]
-            {
-                projection.M11, projection.M12, projection.M13, projection.M14,
-                projection.M21, projection.M22, projection.M23, projection.M24,
-                projection.M31, projection.M32, projection.M33, projection.M34,
-                projection.M41, projection.M42, projection.M43, projection.M44
-            };
-            
-            fixed (float* ptr = matrixData)
-            {
-                gl.UniformMatrix4(projLocation, 1, false, in *ptr);
-            }
-            
-            int colorLocation = gl.GetUniformLocation(shader, "textColor");
+            // Set uniforms. Matrix4x4 stores its elements in the order GL expects, so it
+            // can be passed directly instead of being copied into a new array.
+            // The sampler is bound to texture unit 0 once at startup.
+            gl.UniformMatrix4(projectionLocation, 1, false, in projection.M11);
             gl.Uniform4(colorLocation, color.X, color.Y, color.Z, color.W);
             
-            int textLocation = gl.GetUniformLocation(shader, "text");
-            gl.Uniform1(textLocation, 0);
-            
             // Activate texture
             gl.ActiveTexture(TextureUnit.Texture0);
             gl.BindTexture(TextureTarget.Texture2D, texture);
@@ -8,15 +8,15 @@ using Silk.NET.Input;
 
 namespace FirstPersonRTSGame.Game.UI
 {
-    public class UIManager : IDisposable
+    public sealed class UIManager : IDisposable
     {
-        private GL gl;
+        private readonly GL gl;
         
         // UI components
-        private UIRenderer uiRenderer;
-        private TextRenderer textRenderer;
-        private UIIcons uiIcons;
-        private NotificationSystem notificationSystem;
+        private readonly UIRenderer uiRenderer;
+        private readonly TextRenderer textRenderer;
+        private readonly UIIcons uiIcons;
+        private readonly NotificationSystem notificationSystem;
         
         // UI state
         private bool showInventory = false;
@@ -24,17 +24,21 @@ namespace FirstPersonRTSGame.Game.UI
         private bool showShipInfo = false;
         private bool showHelp = false;
         
+        // Cached "any panel with buttons is showing", refreshed whenever a panel opens or closes
+        // so mouse handling doesn't have to check every flag on every event
+        public bool IsAnyPanelOpen { get; private set; }
+        
         // Screen dimensions
         private int screenWidth;
         private int screenHeight;
         
         // UI element properties
-        private float uiScale = 1.0f;
-        private Vector4 primaryColor = new Vector4(0.15f, 0.15f, 0.15f, 0.85f); // Dark gray with transparency
-        private Vector4 secondaryColor = new Vector4(0.08f, 0.08f, 0.08f, 0.75f); // Darker gray with transparency
-        private Vector4 accentColor = new Vector4(0.4f, 0.7f, 1.0f, 1.0f); // Light blue
-        private Vector4 textColor = new Vector4(0.9f, 0.9f, 0.9f, 1.0f); // Off-white
-        private Vector4 warningColor = new Vector4(0.9f, 0.4f, 0.3f, 1.0f); // Soft red
+        private readonly float uiScale = 1.0f;
+        private readonly Vector4 primaryColor = new Vector4(0.15f, 0.15f, 0.15f, 0.85f); // Dark gray with transparency
+        private readonly Vector4 secondaryColor = new Vector4(0.08f, 0.08f, 0.08f, 0.75f); // Darker gray with transparency
+        private readonly Vector4 accentColor = new Vector4(0.4f, 0.7f, 1.0f, 1.0f); // Light blue
+        private readonly Vector4 textColor = new Vector4(0.9f, 0.9f, 0.9f, 1.0f); // Off-white
+        private readonly Vector4 warningColor = new Vector4(0.9f, 0.4f, 0.3f, 1.0f); // Soft red
         
         // Tooltip system
         private string currentTooltip = "";
@@ -42,11 +46,11 @@ namespace FirstPersonRTSGame.Game.UI
         private bool showTooltip = false;
         
         // Button tracking for interactivity
-        private List<UIButton> activeButtons = new List<UIButton>();
+        private readonly List<UIButton> activeButtons = new List<UIButton>();
         private UIButton? hoveredButton = null;
         
         // Animation system
-        private UIAnimations animations;
+        private readonly UIAnimations animations;
         private float deltaTime = 1.0f / 60.0f; // Default value, will be updated
         
         // UI sizing constants
@@ -418,6 +422,7 @@ namespace FirstPersonRTSGame.Game.UI
                     () => {
                         Console.WriteLine($"Building {buildingTypes[index]}");
                         showBuildingMenu = false;
+                        UpdatePanelState();
                     });
                 
                 // Add tooltip to button
@@ -430,7 +435,7 @@ namespace FirstPersonRTSGame.Game.UI
             UIButton closeButton = AddButton(
                 closeButtonX, closeButtonY, 25, 25, 
                 "X", accentColor, secondaryColor, 
-                () => { showBuildingMenu = false; });
+                () => { showBuildingMenu = false; UpdatePanelState(); });
                 
             // Render footer with close instructions
             textRenderer.RenderText("Press B to close", xPos + width/2 - 60, yPos + height - 30, 1.0f, primaryColor, projection);
@@ -565,7 +570,7 @@ namespace FirstPersonRTSGame.Game.UI
             UIButton closeButton = AddButton(
                 closeButtonX, closeButtonY, 25, 25, 
                 "X", accentColor, secondaryColor, 
-                () => { showHelp = false; });
+                () => { showHelp = false; UpdatePanelState(); });
                 
             // Render footer with close instructions
             textRenderer.RenderText("Press F1 to close", xPos + width/2 - 70, yPos + height - 30, 1.0f, primaryColor, projection);
@@ -615,6 +620,10 @@ namespace FirstPersonRTSGame.Game.UI
         
         public void HandleMouseMove(float mouseX, float mouseY)
         {
+            // Buttons only exist on panels
+            if (!IsAnyPanelOpen)
+                return;
+            
             hoveredButton = null;
             showTooltip = false;
             
@@ -641,6 +650,9 @@ namespace FirstPersonRTSGame.Game.UI
         
         public void HandleMouseClick(float mouseX, float mouseY)
         {
+            if (!IsAnyPanelOpen)
+                return;
+            
             // Check if any button was clicked
             foreach (var button in activeButtons)
             {
@@ -669,6 +681,8 @@ namespace FirstPersonRTSGame.Game.UI
                 animations.PlayAnimation("building_panel", true);
                 animations.PlayAnimation("help_panel", true);
             }
+            
+            UpdatePanelState();
         }
         
         public void ToggleBuildingMenu()
@@ -686,6 +700,8 @@ namespace FirstPersonRTSGame.Game.UI
                 animations.PlayAnimation("inventory_panel", true);
                 animations.PlayAnimation("help_panel", true);
             }
+            
+            UpdatePanelState();
         }
         
         public void ToggleHelp()
@@ -703,9 +719,24 @@ namespace FirstPersonRTSGame.Game.UI
                 animations.PlayAnimation("inventory_panel", true);
                 animations.PlayAnimation("building_panel", true);
             }
+            
+            UpdatePanelState();
+        }
+        
+        private void UpdatePanelState()
+        {
+            // The ship info panel has no toggle yet and its panel adds no buttons, so it doesn't count
+            IsAnyPanelOpen = showInventory || showBuildingMenu || showHelp;
+            
+            // Mouse moves aren't processed with every panel closed, so drop any hover state now
+            if (!IsAnyPanelOpen)
+            {
+                hoveredButton = null;
+                showTooltip = false;
+            }
         }
         
-        public void Update(Player player, World world, Vector2 mousePosition, float deltaTime)
+        public void Update(Player player, World world, float deltaTime)
         {
             // Store delta time for animations
             this.deltaTime = deltaTime;
@@ -17,6 +17,10 @@ namespace FirstPersonRTSGame.Game.UI
         private uint vao;
         private uint vbo;
         
+        // Uniform locations, looked up once after linking
+        private int colorLocation;
+        private int projectionLocation;
+        
         // UI elements
         private Vector4 defaultColor = new Vector4(1.0f, 1.0f, 1.0f, 0.8f);
         
@@ -90,6 +94,13 @@ namespace FirstPersonRTSGame.Game.UI
             gl.DeleteShader(vertexShader);
             gl.DeleteShader(fragmentShader);
             
+            colorLocation = gl.GetUniformLocation(shader, "color");
+            projectionLocation = gl.GetUniformLocation(shader, "projection");
+            
+            // The projection only depends on the screen size, so it's set here and on resize
+            // rather than before every draw
+            UpdateProjection();
+            
             // Create VAO and VBO for UI elements
             vao = gl.GenVertexArray();
             vbo = gl.GenBuffer();
@@ -112,27 +123,8 @@ namespace FirstPersonRTSGame.Game.UI
         {
             // Set color uniform
             gl.UseProgram(shader);
-            int colorLocation = gl.GetUniformLocation(shader, "color");
             gl.Uniform4(colorLocation, color.X, color.Y, color.Z, color.W);
             
-            // Set up orthographic projection matrix for UI
-            Matrix4x4 projection = Matrix4x4.CreateOrthographicOffCenter(0, screenWidth, screenHeight, 0, -1, 1);
-            int projLocation = gl.GetUniformLocation(shader, "projection");
-            
-            // Convert Matrix4x4 to float array
-            float[] matrixData = new float[]
-            {
-                projection.M11, projection.M12, projection.M13, projection.M14,
-                projection.M21, projection.M22, projection.M23, projection.M24,
-                projection.M31, projection.M32, projection.M33, projection.M34,
-                projection.M41, projection.M42, projection.M43, projection.M44
-            };
-            
-            fixed (float* ptr = matrixData)
-            {
-                gl.UniformMatrix4(projLocation, 1, false, ptr);
-            }
-            
             // Draw filled rectangle
             float[] vertices = {
                 x, y,
@@ -183,16 +175,8 @@ namespace FirstPersonRTSGame.Game.UI
             gl.UseProgram(shader);
             
             // Set the color
-            int colorLocation = gl.GetUniformLocation(shader, "color");
             gl.Uniform4(colorLocation, color.X, color.Y, color.Z, color.W);
             
-            // Create the projection matrix (orthographic for 2D UI)
-            var projection = Matrix4x4.CreateOrthographicOffCenter(0, screenWidth, screenHeight, 0, -1, 1);
-            
-            // Set the projection matrix
-            int projectionLocation = gl.GetUniformLocation(shader, "projection");
-            gl.UniformMatrix4(projectionLocation, 1, false, GetMatrix4x4Values(projection));
-            
             // Ensure corner radius is not too large
             cornerRadius = Math.Min(cornerRadius, Math.Min(width / 2, height / 2));
             
@@ -280,7 +264,6 @@ namespace FirstPersonRTSGame.Game.UI
         {
             // Set color uniform
             gl.UseProgram(shader);
-            int colorLocation = gl.GetUniformLocation(shader, "color");
             gl.Uniform4(colorLocation, color.X, color.Y, color.Z, color.W);
             
             // Generate vertices for the corner
@@ -316,27 +299,8 @@ namespace FirstPersonRTSGame.Game.UI
         {
             // Set color uniform
             gl.UseProgram(shader);
-            int colorLocation = gl.GetUniformLocation(shader, "color");
             gl.Uniform4(colorLocation, color.X, color.Y, color.Z, color.W);
             
-            // Set up orthographic projection matrix for UI
-            Matrix4x4 projection = Matrix4x4.CreateOrthographicOffCenter(0, screenWidth, screenHeight, 0, -1, 1);
-            int projLocation = gl.GetUniformLocation(shader, "projection");
-            
-            // Convert Matrix4x4 to float array
-            float[] matrixData = new float[]
-            {
-                projection.M11, projection.M12, projection.M13, projection.M14,
-                projection.M21, projection.M22, projection.M23, projection.M24,
-                projection.M31, projection.M32, projection.M33, projection.M34,
-                projection.M41, projection.M42, projection.M43, projection.M44
-            };
-            
-            fixed (float* ptr = matrixData)
-            {
-                gl.UniformMatrix4(projLocation, 1, false, ptr);
-            }
-            
             // Calculate normal vector
             Vector2 lineDir = new Vector2(x2 - x1, y2 - y1);
             float length = MathF.Sqrt(lineDir.X * lineDir.X + lineDir.Y * lineDir.Y);
@@ -394,27 +358,8 @@ namespace FirstPersonRTSGame.Game.UI
         {
             // Set color uniform
             gl.UseProgram(shader);
-            int colorLocation = gl.GetUniformLocation(shader, "color");
             gl.Uniform4(colorLocation, color.X, color.Y, color.Z, color.W);
             
-            // Set up orthographic projection matrix for UI
-            Matrix4x4 projection = Matrix4x4.CreateOrthographicOffCenter(0, screenWidth, screenHeight, 0, -1, 1);
-            int projLocation = gl.GetUniformLocation(shader, "projection");
-            
-            // Convert Matrix4x4 to float array
-            float[] matrixData = new float[]
-            {
-                projection.M11, projection.M12, projection.M13, projection.M14,
-                projection.M21, projection.M22, projection.M23, projection.M24,
-                projection.M31, projection.M32, projection.M33, projection.M34,
-                projection.M41, projection.M42, projection.M43, projection.M44
-            };
-            
-            fixed (float* ptr = matrixData)
-            {
-                gl.UniformMatrix4(projLocation, 1, false, ptr);
-            }
-            
             // Generate vertices for the circle
             float[] vertices = new float[(segments + 2) * 2];
             
@@ -475,6 +420,18 @@ namespace FirstPersonRTSGame.Game.UI
         {
             screenWidth = width;
             screenHeight = height;
+            UpdateProjection();
+        }
+        
+        private void UpdateProjection()
+        {
+            // Orthographic projection with the origin in the top left corner
+            Matrix4x4 projection = Matrix4x4.CreateOrthographicOffCenter(0, screenWidth, screenHeight, 0, -1, 1);
+            
+            // Uniforms belong to the program, so the value sticks until the next resize
+            gl.UseProgram(shader);
+            gl.UniformMatrix4(projectionLocation, 1, false, GetMatrix4x4Values(projection));
+            gl.UseProgram(0);
         }
         
         private void CheckShaderCompilation(uint shader, string name)
@@ -6,37 +6,44 @@ using Silk.NET.OpenGL;
 
 namespace FirstPersonRTSGame.Game
 {
-    public class World : IWorld, IDisposable
+    public sealed class World : IWorld, IDisposable
     {
         // World properties
         public float Size { get; private set; }
         
         // Game objects collections
-        private List<Resource> resources = new List<Resource>();
-        private List<Building> buildings = new List<Building>();
-        private List<Ship> ships = new List<Ship>();
+        private readonly List<Resource> resources = new List<Resource>();
+        private readonly List<Building> buildings = new List<Building>();
+        private readonly List<Ship> ships = new List<Ship>();
         
         // Quick lookup for resources by type
-        private Dictionary<FirstPersonRTSGame.Engine.ResourceType, List<Resource>> resourcesByType = new Dictionary<FirstPersonRTSGame.Engine.ResourceType, List<Resource>>();
+        private readonly Dictionary<FirstPersonRTSGame.Engine.ResourceType, List<Resource>> resourcesByType = new Dictionary<FirstPersonRTSGame.Engine.ResourceType, List<Resource>>();
+        
+        // Spatial lookup for buildings, rebuilt lazily whenever buildings are added or removed.
+        // Small sets are scanned linearly; the grid only pays off once there are many buildings.
+        private const float BuildingIndexCellSize = 32.0f;
+        private const int BuildingGridThreshold = 64;
+        private ISpatialIndex<Building> buildingIndex = new LinearSpatialIndex<Building>(building => building.Position);
+        private bool buildingIndexDirty = true;
         
         // Random number generator
-        private Random random;
+        private readonly Random random;
         
         // Water level of the world
-        private float waterLevel = 0.0f;
+        private readonly float waterLevel = 0.0f;
         
         // Time of day (0 to 1)
         private float timeOfDay = 0.5f;
-        private float timeRate = 0.005f;
+        private readonly float timeRate = 0.005f;
         
         // Terrain generation parameters
-        private float baseHeight = 0.0f;
-        private float mountainHeight = 40.0f;
-        private float hillHeight = 15.0f;
-        private float noiseScale = 0.01f;
-        private float mountainNoiseScale = 0.005f;
-        private List<Vector3> mountainPeaks = new List<Vector3>();
-        private List<Vector3> plateaus = new List<Vector3>();
+        private readonly float baseHeight = 0.0f;
+        private readonly float mountainHeight = 40.0f;
+        private readonly float hillHeight = 15.0f;
+        private readonly float noiseScale = 0.01f;
+        private readonly float mountainNoiseScale = 0.005f;
+        private readonly List<Vector3> mountainPeaks = new List<Vector3>();
+        private readonly List<Vector3> plateaus = new List<Vector3>();
         
         // Interface implementation properties
         float IWorld.WaterLevel => waterLevel;
@@ -269,7 +276,7 @@ namespace FirstPersonRTSGame.Game
                 float z = (float)random.NextDouble() * Constants.WorldSize;
                 
                 // Keep mountains away from the center of the map where the player starts
-                while (Vector2.Distance(new Vector2(x, z), new Vector2(Constants.WorldSize / 2, Constants.WorldSize / 2)) < 200)
+                while (Vector2.DistanceSquared(new Vector2(x, z), new Vector2(Constants.WorldSize / 2, Constants.WorldSize / 2)) < 200 * 200)
                 {
                     x = (float)random.NextDouble() * Constants.WorldSize;
                     z = (float)random.NextDouble() * Constants.WorldSize;
@@ -301,11 +308,14 @@ namespace FirstPersonRTSGame.Game
             // Add mountain ranges
             foreach (var peak in mountainPeaks)
             {
-                float distanceFromPeak = Vector2.Distance(new Vector2(x, z), new Vector2(peak.X, peak.Z));
+                // Most peaks are out of range, so reject them before paying for the square root
+                float distanceFromPeakSquared = Vector2.DistanceSquared(new Vector2(x, z), new Vector2(peak.X, peak.Z));
                 float mountainRadius = 200.0f; // Control the spread of the mountain
                 
-                if (distanceFromPeak < mountainRadius)
+                if (distanceFromPeakSquared < mountainRadius * mountainRadius)
                 {
+                    float distanceFromPeak = MathF.Sqrt(distanceFromPeakSquared);
+                    
                     // Mountain height decreases with distance from peak using cubic falloff
                     float falloff = 1.0f - (distanceFromPeak / mountainRadius);
                     falloff = falloff * falloff * falloff; // Cubic falloff for steeper mountains
@@ -321,11 +331,13 @@ namespace FirstPersonRTSGame.Game
             // Add plateaus (flat areas)
             foreach (var plateau in plateaus)
             {
-                float distanceFromCenter = Vector2.Distance(new Vector2(x, z), new Vector2(plateau.X, plateau.Z));
+                float distanceFromCenterSquared = Vector2.DistanceSquared(new Vector2(x, z), new Vector2(plateau.X, plateau.Z));
                 float plateauRadius = 100.0f;
                 
-                if (distanceFromCenter < plateauRadius)
+                if (distanceFromCenterSquared < plateauRadius * plateauRadius)
                 {
+                    float distanceFromCenter = MathF.Sqrt(distanceFromCenterSquared);
+                    
                     // Plateau effect with smooth transition at edges
                     float edgeWidth = 20.0f;
                     float smoothFactor = 1.0f;
@@ -411,21 +423,22 @@ namespace FirstPersonRTSGame.Game
         
         public Resource? GetNearestResource(System.Numerics.Vector3 position, FirstPersonRTSGame.Engine.ResourceType type, float maxDistance)
         {
-            if (!resourcesByType.ContainsKey(type) || resourcesByType[type].Count == 0)
+            if (!resourcesByType.TryGetValue(type, out List<Resource>? candidates) || candidates.Count == 0)
             {
                 return null;
             }
             
+            // Compare squared distances; the square root isn't needed to pick the minimum
             Resource? nearest = null;
-            float nearestDistance = maxDistance;
+            float nearestDistanceSquared = maxDistance * maxDistance;
             
-            foreach (var resource in resourcesByType[type])
+            foreach (var resource in candidates)
             {
-                float distance = System.Numerics.Vector3.Distance(position, resource.Position);
+                float distanceSquared = System.Numerics.Vector3.DistanceSquared(position, resource.Position);
                 
-                if (distance < nearestDistance)
+                if (distanceSquared < nearestDistanceSquared)
                 {
-                    nearestDistance = distance;
+                    nearestDistanceSquared = distanceSquared;
                     nearest = resource;
                 }
             }
@@ -433,14 +446,43 @@ namespace FirstPersonRTSGame.Game
             return nearest;
         }
         
+        public void GetBuildingsInRange(System.Numerics.Vector3 position, float radius, List<Building> results)
+        {
+            EnsureBuildingIndex();
+            buildingIndex.FindInRange(position, radius, results);
+        }
+        
+        private void EnsureBuildingIndex()
+        {
+            if (!buildingIndexDirty)
+                return;
+                
+            // Switch index type when the building count crosses the threshold
+            if (buildings.Count >= BuildingGridThreshold && buildingIndex is LinearSpatialIndex<Building>)
+            {
+                buildingIndex = new GridSpatialIndex<Building>(building => building.Position, BuildingIndexCellSize);
+            }
+            else if (buildings.Count < BuildingGridThreshold && buildingIndex is GridSpatialIndex<Building>)
+            {
+                buildingIndex = new LinearSpatialIndex<Building>(building => building.Position);
+            }
+            
+            buildingIndex.Rebuild(buildings);
+            buildingIndexDirty = false;
+        }
+        
         public void AddBuilding(Building building)
         {
             buildings.Add(building);
+            buildingIndexDirty = true;
         }
         
         public void RemoveBuilding(Building building)
         {
-            buildings.Remove(building);
+            if (buildings.Remove(building))
+            {
+                buildingIndexDirty = true;
+            }
         }
         
         public void AddShip(Ship ship)
@@ -0,0 +1,33 @@
+using Xunit;
+using System;
+using System.Diagnostics;
+using FirstPersonRTSGame.Engine;
+
+namespace FirstPersonRTSGame.Tests
+{
+    public class FrameLimiterTests
+    {
+        [Fact]
+        public void Wait_HoldsEachFrameForAtLeastTheFramePeriod()
+        {
+            // Arrange
+            var stopwatch = Stopwatch.StartNew();
+            var limiter = new FrameLimiter(100.0);
+            
+            // Act
+            for (int i = 0; i < 3; i++)
+            {
+                limiter.Wait();
+            }
+            
+            // Assert
+            Assert.True(stopwatch.Elapsed.TotalMilliseconds >= 30.0);
+        }
+        
+        [Fact]
+        public void Constructor_RejectsNonPositiveFrameRate()
+        {
+            Assert.Throws<ArgumentOutOfRangeException>(() => new FrameLimiter(0));
+        }
+    }
+} 
\ No newline at end of file
@@ -0,0 +1,138 @@
+using Xunit;
+using System;
+using System.Numerics;
+using System.Collections.Generic;
+using FirstPersonRTSGame.Engine;
+
+namespace FirstPersonRTSGame.Tests.World
+{
+    public class SpatialIndexTests
+    {
+        [Fact]
+        public void GridIndex_MatchesLinearScan()
+        {
+            // Arrange
+            var random = new Random(7);
+            var markers = new List<Marker>();
+            for (int i = 0; i < 200; i++)
+            {
+                markers.Add(new Marker(new Vector3((float)random.NextDouble() * 1000, 0, (float)random.NextDouble() * 1000)));
+            }
+            
+            var index = new GridSpatialIndex<Marker>(m => m.Position, 32.0f);
+            index.Rebuild(markers);
+            
+            for (int i = 0; i < 50; i++)
+            {
+                var query = new Vector3((float)random.NextDouble() * 1000, 0, (float)random.NextDouble() * 1000);
+                var results = new List<Marker>();
+                
+                // Act
+                index.FindInRange(query, 75.0f, results);
+                
+                // Assert
+                var expected = FindInRangeLinear(markers, query, 75.0f);
+                Assert.Equal(expected.Count, results.Count);
+                Assert.All(expected, m => Assert.Contains(m, results));
+            }
+        }
+        
+        [Fact]
+        public void GridIndex_FindsAllObjectsInRange()
+        {
+            // Arrange
+            var inside = new Marker(new Vector3(103, 0, 104));
+            var edge = new Marker(new Vector3(100, 0, 95));
+            var outside = new Marker(new Vector3(120, 0, 100));
+            var index = new GridSpatialIndex<Marker>(m => m.Position, 8.0f);
+            index.Rebuild(new List<Marker> { inside, edge, outside });
+            var results = new List<Marker>();
+            
+            // Act
+            index.FindInRange(new Vector3(100, 0, 100), 5.0f, results);
+            
+            // Assert
+            Assert.Equal(2, results.Count);
+            Assert.Contains(inside, results);
+            Assert.Contains(edge, results);
+        }
+        
+        [Fact]
+        public void LinearIndex_MatchesGridIndex()
+        {
+            // Arrange - enough markers to cover both the SIMD path and the remainder loop
+            var random = new Random(11);
+            var markers = new List<Marker>();
+            for (int i = 0; i < 37; i++)
+            {
+                markers.Add(new Marker(new Vector3((float)random.NextDouble() * 200, 0, (float)random.NextDouble() * 200)));
+            }
+            
+            var linear = new LinearSpatialIndex<Marker>(m => m.Position);
+            var grid = new GridSpatialIndex<Marker>(m => m.Position, 16.0f);
+            linear.Rebuild(markers);
+            grid.Rebuild(markers);
+            
+            for (int i = 0; i < 20; i++)
+            {
+                var query = new Vector3((float)random.NextDouble() * 200, 0, (float)random.NextDouble() * 200);
+                var linearResults = new List<Marker>();
+                var gridResults = new List<Marker>();
+                
+                // Act
+                linear.FindInRange(query, 25.0f, linearResults);
+                grid.FindInRange(query, 25.0f, gridResults);
+                
+                // Assert
+                Assert.Equal(gridResults.Count, linearResults.Count);
+                Assert.All(linearResults, m => Assert.Contains(m, gridResults));
+            }
+        }
+        
+        [Fact]
+        public void LinearIndex_ForgetsRemovedObjectsOnRebuild()
+        {
+            // Arrange
+            var kept = new Marker(new Vector3(10, 0, 10));
+            var removed = new Marker(new Vector3(1, 0, 1));
+            var index = new LinearSpatialIndex<Marker>(m => m.Position);
+            index.Rebuild(new List<Marker> { removed, kept });
+            
+            // Act
+            index.Rebuild(new List<Marker> { kept });
+            
+            // Assert
+            var results = new List<Marker>();
+            index.FindInRange(Vector3.Zero, 100.0f, results);
+            Assert.Equal(1, index.Count);
+            Assert.Single(results);
+            Assert.Same(kept, results[0]);
+        }
+        
+        private static List<Marker> FindInRangeLinear(List<Marker> markers, Vector3 position, float radius)
+        {
+            var results = new List<Marker>();
+            
+            foreach (var marker in markers)
+            {
+                float distance = Vector2.Distance(new Vector2(position.X, position.Z), new Vector2(marker.Position.X, marker.Position.Z));
+                if (distance <= radius)
+                {
+                    results.Add(marker);
+                }
+            }
+            
+            return results;
+        }
+        
+        private class Marker
+        {
+            public Vector3 Position { get; }
+            
+            public Marker(Vector3 position)
+            {
+                Position = position;
+            }
+        }
+    }
+} 
\ No newline at end of file
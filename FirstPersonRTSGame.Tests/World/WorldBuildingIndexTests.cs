@@ -0,0 +1,82 @@
+using Xunit;
+using System.Numerics;
+using System.Collections.Generic;
+using FirstPersonRTSGame.Engine;
+using FirstPersonRTSGame.Game;
+using GameWorld = FirstPersonRTSGame.Game.World;
+
+namespace FirstPersonRTSGame.Tests.World
+{
+    public class WorldBuildingIndexTests
+    {
+        // Far from the generated buildings around the map center
+        private static readonly Vector3 EmptySpot = new Vector3(20, 0, 20);
+        
+        [Fact]
+        public void GetBuildingsInRange_SeesAddedBuilding()
+        {
+            // Arrange - query once so the index is built before the change
+            var world = new GameWorld();
+            var results = new List<Building>();
+            world.GetBuildingsInRange(EmptySpot, 5.0f, results);
+            Assert.Empty(results);
+            
+            var building = new Building(EmptySpot, BuildingType.Workshop);
+            
+            // Act
+            world.AddBuilding(building);
+            world.GetBuildingsInRange(EmptySpot, 5.0f, results);
+            
+            // Assert
+            Assert.Single(results);
+            Assert.Same(building, results[0]);
+        }
+        
+        [Fact]
+        public void GetBuildingsInRange_ForgetsRemovedBuilding()
+        {
+            // Arrange
+            var world = new GameWorld();
+            var building = new Building(EmptySpot, BuildingType.Workshop);
+            world.AddBuilding(building);
+            
+            var results = new List<Building>();
+            world.GetBuildingsInRange(EmptySpot, 5.0f, results);
+            Assert.Single(results);
+            results.Clear();
+            
+            // Act
+            world.RemoveBuilding(building);
+            world.GetBuildingsInRange(EmptySpot, 5.0f, results);
+            
+            // Assert
+            Assert.Empty(results);
+        }
+        
+        [Fact]
+        public void GetBuildingsInRange_FindsBuildingsAmongMany()
+        {
+            // Arrange - a long row of buildings spanning many grid cells
+            var world = new GameWorld();
+            var results = new List<Building>();
+            world.GetBuildingsInRange(EmptySpot, 5.0f, results);
+            
+            var added = new List<Building>();
+            for (int i = 0; i < 100; i++)
+            {
+                var building = new Building(new Vector3(20 + i * 5, 0, 20), BuildingType.Workshop);
+                added.Add(building);
+                world.AddBuilding(building);
+            }
+            
+            // Act
+            world.GetBuildingsInRange(new Vector3(20, 0, 20), 12.0f, results);
+            
+            // Assert - only the first three are within range
+            Assert.Equal(3, results.Count);
+            Assert.Contains(added[0], results);
+            Assert.Contains(added[1], results);
+            Assert.Contains(added[2], results);
+        }
+    }
+} 
\ No newline at end of file